@@ -9,7 +9,7 @@ Generates a branded, layout-ready PNG containing:
   • Optional footer
 
 Quick start:
-  pip install qrcode pillow
+  pip install segno pillow numpy
   python main.py "https://your-url.com" --out qr.png --title "Biox Systems" --subtitle "AI QR Code Generator"
 
 Key optimizations:
@@ -22,25 +22,48 @@ Key optimizations:
 from __future__ import annotations
 
 import argparse
+import concurrent.futures
+import functools
+import io
+import json
 import os
+import re
+import sys
 from dataclasses import dataclass
 from typing import Optional, Tuple, List
 
+import numpy as np
 from PIL import Image, ImageDraw, ImageFont, ImageColor
 from PIL.Image import Resampling
 
-import qrcode
-from qrcode.constants import ERROR_CORRECT_H
+import segno
 
 
 # ------------------------------
 # Utilities
 # ------------------------------
 
+# Parsed TrueType fonts (or None for a failed probe), keyed by (name, size)
+_FONT_CACHE: dict[Tuple[str, int], Optional[ImageFont.FreeTypeFont]] = {}
+
+
+def _truetype(name: str, size: int) -> Optional[ImageFont.FreeTypeFont]:
+    """Open a TrueType font once per (name, size); remembers misses too."""
+    key = (name, size)
+    if key not in _FONT_CACHE:
+        try:
+            _FONT_CACHE[key] = ImageFont.truetype(name, size)
+        except Exception:
+            _FONT_CACHE[key] = None
+    return _FONT_CACHE[key]
+
+
+@functools.lru_cache(maxsize=32)
 def load_font(size: int, bold: bool = False) -> ImageFont.FreeTypeFont | ImageFont.ImageFont:
     """
     Best-effort load of a sans or sans-bold font; falls back to default bitmap font.
     DejaVuSans is commonly available on many systems.
+    Results are cached; the returned font objects are shared and must not be mutated.
     """
     candidates = [
         ("DejaVuSans-Bold.ttf" if bold else "DejaVuSans.ttf"),
@@ -48,10 +71,9 @@ def load_font(size: int, bold: bool = False) -> ImageFont.FreeTypeFont | ImageFo
         ("Helvetica Bold.ttf" if bold else "Helvetica.ttf"),
     ]
     for name in candidates:
-        try:
-            return ImageFont.truetype(name, size)
-        except Exception:
-            continue
+        font = _truetype(name, size)
+        if font is not None:
+            return font
     return ImageFont.load_default()
 
 
@@ -98,80 +120,147 @@ def compute_box_size(target_px: int, modules: int, border: int) -> int:
     return max(1, target_px // denom)
 
 
+@functools.lru_cache(maxsize=128)
+def _encode(data: str, border: int) -> Tuple[int, np.ndarray]:
+    """
+    Encode `data` once and cache the result for repeated renders.
+    Returns (modules, grid) where grid is a read-only uint8 array that
+    already includes the quiet zone.
+    """
+    # Automatic version, error level H, never a Micro QR
+    qr = segno.make(data, error="h", boost_error=False, micro=False)
+    grid = np.pad(np.asarray(qr.matrix, dtype=np.uint8), border, constant_values=0)
+    grid.setflags(write=False)  # shared between cache hits
+    return len(qr.matrix), grid
+
+
 def build_qr_image(data: str, target_px: int, border: int,
                    dark: str, light: str) -> Image.Image:
     """
     Build a QR image close to `target_px` without resizing the QR grid.
-    Returns an RGBA image. May be slightly smaller than target_px due to integer math.
+    Returns a two-color palette ("P") image, one byte per pixel; convert on demand.
+    May be slightly smaller than target_px due to integer math.
     """
-    # First pass: probe to learn module count
-    probe = qrcode.QRCode(
-        version=None,              # automatic sizing
-        error_correction=ERROR_CORRECT_H,
-        box_size=10,               # provisional
-        border=border,
-    )
-    probe.add_data(data)
-    probe.make(fit=True)
-    modules = probe.modules_count
+    modules, grid = _encode(data, border)
 
-    # Compute a clean integer box size, then render for real
+    # Compute a clean integer box size
     box_size = compute_box_size(target_px, modules, border)
 
-    qr = qrcode.QRCode(
-        version=None,
-        error_correction=ERROR_CORRECT_H,
-        box_size=box_size,
-        border=border,
-    )
-    qr.add_data(data)
-    qr.make(fit=True)
-    img = qr.make_image(fill_color=dark, back_color=light).convert("RGBA")
+    # Rasterize with numpy instead of one rectangle draw per module:
+    # broadcast each module to a box_size x box_size block (a pure copy, one
+    # write per pixel) rather than np.kron's per-pixel multiply.
+    n = grid.shape[0]
+    big = np.broadcast_to(grid[:, None, :, None], (n, box_size, n, box_size))
+    big = big.reshape(n * box_size, n * box_size)
+
+    # Palette indices double as the color LUT: 0 = light, 1 = dark
+    # (putpalette turns the "L" image into "P"; colors are applied in C on convert)
+    img = Image.fromarray(big)
+    img.putpalette(ImageColor.getrgb(light)[:3] + ImageColor.getrgb(dark)[:3])
     return img
 
 
+@functools.lru_cache(maxsize=8)
+def _load_logo(logo_path: str, mtime_ns: int, max_side: int) -> Image.Image:
+    """
+    Decode the logo and scale it to fit `max_side` (never upscaled), cached per
+    (path, mtime, max_side) so an edited file is picked up. BILINEAR is plenty
+    for a one-off ~18% overlay. Read-only.
+    """
+    logo = Image.open(logo_path).convert("RGBA")
+    lw, lh = logo.size
+    s = min(max_side / lw, max_side / lh, 1.0)
+    if s < 1.0:
+        logo = logo.resize((max(1, int(lw * s)), max(1, int(lh * s))), resample=Resampling.BILINEAR)
+    return logo
+
+
+@functools.lru_cache(maxsize=8)
+def _make_backing(w: int, h: int, radius: int, fill: Tuple[int, int, int, int]) -> Image.Image:
+    """Rounded-rectangle logo backing, rasterized once per size. Callers must .copy() before drawing on it."""
+    backing = Image.new("RGBA", (w, h), fill[:3] + (0,))
+    draw = ImageDraw.Draw(backing)
+    draw.rounded_rectangle([(0, 0), (w - 1, h - 1)], radius=radius, fill=fill)
+    return backing
+
+
 def paste_center_logo(qr_img: Image.Image, logo_path: Optional[str]) -> Image.Image:
     """
     Paste a small logo at the center of the QR.
     - Scales the logo to ~18% of the QR side.
     - Adds a rounded white backing for contrast.
+    Composites in place: an RGBA `qr_img` is mutated and returned as-is.
     """
-    if not logo_path or not os.path.exists(logo_path):
+    if not logo_path:
         return qr_img
 
     qr_w, qr_h = qr_img.size
     max_side = int(min(qr_w, qr_h) * 0.18)
 
-    logo = Image.open(logo_path).convert("RGBA")
-    logo.thumbnail((max_side, max_side), resample=Resampling.LANCZOS)
+    # A single stat both detects an unreachable logo and keys the decode cache.
+    # Like os.path.exists(), any stat failure skips the logo; decode errors raise.
+    try:
+        mtime = os.stat(logo_path).st_mtime_ns
+    except OSError:
+        return qr_img
+    logo = _load_logo(logo_path, mtime, max_side)
+
+    # Only the logo path needs alpha; expand the palette QR here
+    if qr_img.mode != "RGBA":
+        qr_img = qr_img.convert("RGBA")
 
     # Rounded white backing with slight padding
     pad = max(4, max(logo.size) // 12)
     bg_w, bg_h = logo.size[0] + pad * 2, logo.size[1] + pad * 2
-    backing = Image.new("RGBA", (bg_w, bg_h), (255, 255, 255, 0))
-    draw = ImageDraw.Draw(backing)
     radius = min(bg_w, bg_h) // 5
-    draw.rounded_rectangle([(0, 0), (bg_w - 1, bg_h - 1)], radius=radius, fill=(255, 255, 255, 235))
+    backing = _make_backing(bg_w, bg_h, radius, (255, 255, 255, 235)).copy()
     backing.alpha_composite(logo, (pad, pad))
 
     # Center composite onto QR
     x = (qr_w - bg_w) // 2
     y = (qr_h - bg_h) // 2
-    out = qr_img.copy()
-    out.alpha_composite(backing, (x, y))
-    return out
+    qr_img.alpha_composite(backing, (x, y))
+    return qr_img
 
 
 # ------------------------------
 # Layout Composition
 # ------------------------------
 
-def text_size(draw: ImageDraw.ImageDraw, text: str, font: ImageFont.ImageFont) -> Tuple[int, int]:
-    """Return (width, height) using textbbox for reliable metrics."""
-    if not text:
-        return (0, 0)
-    bbox = draw.textbbox((0, 0), text, font=font)
-    return (bbox[2] - bbox[0], bbox[3] - bbox[1])
+@functools.lru_cache(maxsize=256)
+def _render_text_strip(text: str, font: ImageFont.ImageFont, spacing: int = 4,
+                       align: str = "center") -> Tuple[Image.Image, Tuple[int, int]]:
+    """
+    Lay out `text` once and cache it as an "L" coverage mask of exact bbox size.
+    Returns (mask, (ox, oy)): paste the fill color through the mask at the
+    draw origin + (ox, oy). Fonts are shared via load_font, so identity is a
+    stable cache key. Multi-line text ("\\n") is supported.
+    """
+    probe = ImageDraw.Draw(Image.new("L", (1, 1)))  # metrics only, on cache miss
+    left, top, right, bottom = probe.multiline_textbbox((0, 0), text, font=font,
+                                                        spacing=spacing, align=align)
+    mask = Image.new("L", (max(1, right - left), max(1, bottom - top)), 0)
+    ImageDraw.Draw(mask).multiline_text((-left, -top), text, font=font, fill=255,
+                                        spacing=spacing, align=align)
+    return mask, (left, top)
+
+
+def wrap_words(text: str, max_chars: int) -> List[str]:
+    """Greedy word wrap to at most `max_chars` per line (minimum 12); never splits words."""
+    line_width = max(12, max_chars)
+    lines: List[str] = []
+    current = ""
+    for w in text.split():
+        test = (current + " " + w).strip()
+        if len(test) <= line_width:
+            current = test
+        else:
+            if current:
+                lines.append(current)
+            current = w
+    if current:
+        lines.append(current)
+    return lines
 
 
 def compose_layout(qr_img: Image.Image, cfg: LayoutConfig) -> Image.Image:
@@ -187,116 +276,249 @@ def compose_layout(qr_img: Image.Image, cfg: LayoutConfig) -> Image.Image:
     qr_w, qr_h = qr_img.size
     canvas_w = qr_w + cfg.pad * 2
 
-    # Pre-compute estimated height for canvas
-    dummy = Image.new("RGBA", (1, 1), cfg.bg_color)
-    d = ImageDraw.Draw(dummy)
-    est_h = cfg.pad  # top pad baseline
-
-    if cfg.title:
-        est_h += text_size(d, cfg.title, title_font)[1] + cfg.gap_title_sub
-    if cfg.subtitle:
-        est_h += text_size(d, cfg.subtitle, subtitle_font)[1] + cfg.gap_sub_qr
-
-    est_h += qr_h + cfg.gap_qr_footer
-
-    # Estimate 1–2 lines for footer; actual drawing will use same font
+    # Lay out each text block once (cached across posters); strips give exact sizes
+    title = _render_text_strip(cfg.title, title_font) if cfg.title else None
+    subtitle = _render_text_strip(cfg.subtitle, subtitle_font) if cfg.subtitle else None
+    footer = None
     if cfg.footer:
-        est_h += text_size(d, "Ag", footer_font)[1] * 2 + 12
-
+        # Simple char-wrap so it's predictable
+        wrapped = "\n".join(wrap_words(cfg.footer, cfg.max_footer_width_chars))
+        footer = _render_text_strip(wrapped, footer_font, spacing=4, align="center")
+
+    # Exact canvas height
+    est_h = cfg.pad // 2  # top pad, matches the drawing start below
+    if title:
+        est_h += title[0].height + cfg.gap_title_sub
+    if subtitle:
+        est_h += subtitle[0].height + cfg.gap_sub_qr
+    est_h += qr_h + cfg.gap_qr_footer
+    if footer:
+        est_h += footer[1][1] + footer[0].height  # pasted at y + oy; keep descenders on canvas
     est_h += cfg.pad  # bottom pad
 
-    # Create canvas + draw
-    canvas = Image.new("RGBA", (canvas_w, est_h), cfg.bg_color)
-    draw = ImageDraw.Draw(canvas)
+    canvas = Image.new("RGB", (canvas_w, est_h), cfg.bg_color)  # final mode; no convert at the end
+
+    def paste_text(strip: Tuple[Image.Image, Tuple[int, int]], y: int, fill: str) -> int:
+        """Paste a centered text strip with its top edge at `y`; return its height."""
+        mask, (ox, oy) = strip
+        canvas.paste(fill, ((canvas_w - mask.width) // 2 + ox, y + oy), mask)
+        return mask.height
 
     y = cfg.pad // 2
 
     # Title
-    if cfg.title:
-        tw, th = text_size(draw, cfg.title, title_font)
-        draw.text(((canvas_w - tw) // 2, y), cfg.title, font=title_font, fill="#000000")
-        y += th + cfg.gap_title_sub
+    if title:
+        y += paste_text(title, y, "#000000") + cfg.gap_title_sub
 
     # Subtitle
-    if cfg.subtitle:
-        sw, sh = text_size(draw, cfg.subtitle, subtitle_font)
-        draw.text(((canvas_w - sw) // 2, y), cfg.subtitle, font=subtitle_font, fill="#333333")
-        y += sh + cfg.gap_sub_qr
+    if subtitle:
+        y += paste_text(subtitle, y, "#333333") + cfg.gap_sub_qr
 
     # QR
     x_qr = (canvas_w - qr_w) // 2
-    canvas.alpha_composite(qr_img, (x_qr, y))
+    # Opaque palette QR: plain copy; RGBA (logo composited): its alpha is the mask
+    canvas.paste(qr_img, (x_qr, y), qr_img if qr_img.mode == "RGBA" else None)
     y += qr_h + cfg.gap_qr_footer
 
-    # Footer (simple char-wrap so it's predictable)
-    if cfg.footer:
-        line_width = max(12, cfg.max_footer_width_chars)
-        # Manual wrap without splitting words too aggressively
-        words = cfg.footer.split()
-        lines: List[str] = []
-        current = ""
-        for w in words:
-            test = (current + " " + w).strip()
-            if len(test) <= line_width:
-                current = test
-            else:
-                if current:
-                    lines.append(current)
-                current = w
-        if current:
-            lines.append(current)
-
-        for line in lines:
-            fw, fh = text_size(draw, line, footer_font)
-            draw.text(((canvas_w - fw) // 2, y), line, font=footer_font, fill="#555555")
-            y += fh + 4
-
-    return canvas.convert("RGB")
+    # Footer
+    if footer:
+        paste_text(footer, y, "#555555")
+
+    return canvas
 
 
 # ------------------------------
-# CLI
+# Poster Generation
 # ------------------------------
 
-def main() -> None:
-    ap = argparse.ArgumentParser(description="Biox Systems — AI QR Code Generator (Optimized)")
-    ap.add_argument("url", help="URL to encode into the QR code")
-    ap.add_argument("--out", default="qr_biox.png", help="Output PNG path (default: qr_biox.png)")
-    ap.add_argument("--title", default="Biox Systems", help="Title text ('' to hide)")
-    ap.add_argument("--subtitle", default="AI QR Code Generator", help="Subtitle text ('' to hide)")
-    ap.add_argument("--footer", default="Biox Systems • AI QR Code Generator • 1994→2025", help="Footer text ('' to hide)")
-    ap.add_argument("--logo", default=None, help="Optional PNG logo to place at QR center")
-    ap.add_argument("--dark", default="#000000", help="Dark (QR) color; hex or name")
-    ap.add_argument("--light", default="#FFFFFF", help="Light (background) color; hex or name")
-    ap.add_argument("--size", type=int, default=1024, help="Target QR pixel size (default 1024)")
-    ap.add_argument("--border", type=int, default=4, help="QR border/quiet zone modules (default 4)")
-    ap.add_argument("--pad", type=int, default=80, help="Outer canvas padding in pixels (default 80)")
-    args = ap.parse_args()
-
-    # Normalize colors
-    dark = parse_color(args.dark, "#000000")
-    light = parse_color(args.light, "#FFFFFF")
-
+def generate_one(url: str, out_path: str, cfg: LayoutConfig, size: int = 1024, border: int = 4,
+                 logo: Optional[str] = None, png_level: int = 1) -> None:
+    """
+    Full pipeline for one poster: encode -> rasterize -> logo -> compose -> PNG.
+    `cfg.dark_color` / `cfg.bg_color` are used as the QR dark / light colors.
+    """
     # Build QR at target size (no post-resize)
-    qr_img = build_qr_image(args.url, target_px=args.size, border=args.border, dark=dark, light=light)
+    qr_img = build_qr_image(url, target_px=size, border=border, dark=cfg.dark_color, light=cfg.bg_color)
 
     # Optional center logo
-    qr_img = paste_center_logo(qr_img, args.logo)
+    qr_img = paste_center_logo(qr_img, logo)
 
     # Compose final poster
-    cfg = LayoutConfig(
+    final_img = compose_layout(qr_img, cfg)
+
+    # Save PNG ("-" streams to stdout in a single write, e.g. behind a pipe or HTTP handler)
+    if out_path == "-":
+        buf = io.BytesIO()
+        final_img.save(buf, format="PNG", compress_level=png_level, optimize=False)
+        sys.stdout.buffer.write(buf.getbuffer())
+        sys.stdout.buffer.flush()
+    else:
+        final_img.save(out_path, format="PNG", compress_level=png_level, optimize=False)
+
+
+def layout_from_args(args: argparse.Namespace) -> LayoutConfig:
+    """Build a LayoutConfig from parsed CLI (or manifest) options, normalizing colors."""
+    return LayoutConfig(
         title=args.title,
         subtitle=args.subtitle,
         footer=args.footer,
-        bg_color=light,
-        dark_color=dark,
+        bg_color=parse_color(args.light, "#FFFFFF"),
+        dark_color=parse_color(args.dark, "#000000"),
         pad=args.pad,
     )
-    final_img = compose_layout(qr_img, cfg)
 
-    # Save PNG
-    final_img.save(args.out, format="PNG")
-    print(f"✅ Saved: {args.out}")
+
+# Per-poster options shared by the CLI and batch manifests: dest -> add_argument kwargs.
+# The flag is "--" + dest with "_" -> "-" (png_level -> --png-level).
+POSTER_OPTIONS: dict[str, dict] = {
+    "out": dict(default="qr_biox.png", help="Output PNG path, or '-' for stdout (default: qr_biox.png)"),
+    "title": dict(default="Biox Systems", help="Title text ('' to hide)"),
+    "subtitle": dict(default="AI QR Code Generator", help="Subtitle text ('' to hide)"),
+    "footer": dict(default="Biox Systems • AI QR Code Generator • 1994→2025", help="Footer text ('' to hide)"),
+    "logo": dict(default=None, help="Optional PNG logo to place at QR center"),
+    "dark": dict(default="#000000", help="Dark (QR) color; hex or name"),
+    "light": dict(default="#FFFFFF", help="Light (background) color; hex or name"),
+    "size": dict(type=int, default=1024, help="Target QR pixel size (default 1024)"),
+    "border": dict(type=int, default=4, help="QR border/quiet zone modules (default 4)"),
+    "pad": dict(type=int, default=80, help="Outer canvas padding in pixels (default 80)"),
+    "png_level": dict(type=int, default=1, choices=range(10), metavar="0-9",
+                      help="PNG zlib compression level (default 1: fast; 9: smallest)"),
+}
+
+
+def load_manifest(path: str, defaults: argparse.Namespace, ap: argparse.ArgumentParser) -> List[argparse.Namespace]:
+    """
+    Read a JSON list of poster entries. Each entry needs "url" and "out" and may
+    override any other POSTER_OPTIONS key (e.g. "title", "logo", "png_level");
+    unspecified options fall back to the command line values. Values are checked
+    like command line arguments: integers must be JSON ints or digit strings.
+    """
+    try:
+        with open(path, encoding="utf-8") as fh:
+            entries = json.load(fh)
+    except (OSError, ValueError) as exc:
+        ap.error(f"cannot read manifest {path}: {exc}")
+    if not isinstance(entries, list):
+        ap.error(f"manifest {path} must contain a JSON list")
+
+    base = {k: getattr(defaults, k) for k in ("url", *POSTER_OPTIONS)}
+    jobs: List[argparse.Namespace] = []
+    for i, entry in enumerate(entries):
+        if not isinstance(entry, dict) or not all(isinstance(entry.get(k), str) and entry[k]
+                                                  for k in ("url", "out")):
+            ap.error(f"manifest entry {i}: needs an object with string 'url' and 'out'")
+        if entry["out"] == "-":
+            ap.error(f"manifest entry {i}: 'out' cannot be '-' (stdout holds a single PNG)")
+        unknown = sorted(set(entry) - set(base))
+        if unknown:
+            ap.error(f"manifest entry {i}: unknown option(s) {', '.join(unknown)}")
+
+        values = {"url": entry["url"]}
+        for key, value in entry.items():
+            if key == "url":
+                continue
+            spec = POSTER_OPTIONS[key]
+            if value is None and spec["default"] is None:
+                values[key] = None  # e.g. "logo": null
+                continue
+            if spec.get("type") is int:
+                # Same inputs argparse accepts: no bools, no floats (12.9 must not become 12)
+                if isinstance(value, bool) or not (
+                        isinstance(value, int) or (isinstance(value, str) and re.fullmatch(r"[+-]?\d+", value))):
+                    ap.error(f"manifest entry {i}: invalid {key} value {value!r}")
+                value = int(value)
+            elif not isinstance(value, str):
+                ap.error(f"manifest entry {i}: {key} must be a string, got {value!r}")
+            choices = spec.get("choices")
+            if choices is not None and value not in choices:
+                ap.error(f"manifest entry {i}: {key} must be one of {spec.get('metavar') or list(choices)}, "
+                         f"got {value!r}")
+            values[key] = value
+        jobs.append(argparse.Namespace(**{**base, **values}))
+    return jobs
+
+
+def load_url_list(path: str, out_template: str, defaults: argparse.Namespace,
+                  ap: argparse.ArgumentParser) -> List[argparse.Namespace]:
+    """
+    Read one URL per line (blank lines and '#' comments skipped). Output paths are
+    numbered from `out_template`: qr_biox.png -> qr_biox_001.png, qr_biox_002.png, ...
+    """
+    try:
+        with open(path, encoding="utf-8") as fh:
+            urls = [ln.strip() for ln in fh if ln.strip() and not ln.lstrip().startswith("#")]
+    except OSError as exc:
+        ap.error(f"cannot read URL list {path}: {exc}")
+
+    stem, ext = os.path.splitext(out_template)
+    width = max(3, len(str(len(urls))))
+    base = vars(defaults)
+    return [argparse.Namespace(**{**base, "url": url, "out": f"{stem}_{i:0{width}d}{ext or '.png'}"})
+            for i, url in enumerate(urls, start=1)]
+
+
+# ------------------------------
+# CLI
+# ------------------------------
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Biox Systems — AI QR Code Generator (Optimized)")
+    ap.add_argument("url", nargs="?", help="URL to encode into the QR code")
+    for dest, spec in POSTER_OPTIONS.items():
+        ap.add_argument("--" + dest.replace("_", "-"), **spec)
+    ap.add_argument("--batch-manifest", default=None, metavar="FILE.json",
+                    help="Generate every poster listed in a JSON manifest (reuses QR/text caches)")
+    ap.add_argument("--input", default=None, metavar="URLS.txt",
+                    help="Generate one poster per URL line in parallel; --out names are numbered")
+    ap.add_argument("--workers", type=int, default=None,
+                    help="Worker processes for --input (default: CPU count, at most one per URL)")
+    args = ap.parse_args()
+
+    if args.batch_manifest and args.input:
+        ap.error("--batch-manifest and --input are mutually exclusive")
+
+    if args.input:
+        if args.url:
+            ap.error("a positional URL cannot be combined with --input")
+        if args.out == "-":
+            ap.error("--out - cannot be combined with --input")
+        if args.workers is not None and args.workers < 1:
+            ap.error("--workers must be at least 1")
+        jobs = load_url_list(args.input, args.out, args, ap)
+        if not jobs:
+            return
+        workers = args.workers or os.cpu_count() or 1
+        if sys.platform == "win32":
+            workers = min(workers, 61)  # ProcessPoolExecutor limit on Windows
+        workers = min(workers, len(jobs))  # no idle workers for short lists
+        # Each poster is independent and CPU-bound in Pillow/zlib; fan out across processes
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(generate_one, job.url, job.out, layout_from_args(job), size=job.size,
+                            border=job.border, logo=job.logo, png_level=job.png_level)
+                for job in jobs
+            ]
+            for job, fut in zip(jobs, futures):
+                fut.result()  # re-raises worker errors
+                print(f"✅ Saved: {job.out}")
+        return
+
+    if args.batch_manifest:
+        if args.url:
+            ap.error("a positional URL cannot be combined with --batch-manifest")
+        jobs = load_manifest(args.batch_manifest, args, ap)
+    elif args.url:
+        jobs = [args]
+    else:
+        ap.error("a URL is required unless --batch-manifest or --input is given")
+
+    for job in jobs:
+        generate_one(job.url, job.out, layout_from_args(job), size=job.size, border=job.border,
+                     logo=job.logo, png_level=job.png_level)
+        if job.out == "-":
+            print("✅ Saved: <stdout>", file=sys.stderr)  # keep stdout pure PNG
+        else:
+            print(f"✅ Saved: {job.out}")
 
 
 if __name__ == "__main__":
@@ -32,7 +32,7 @@ fi
 source .venv/bin/activate
 
 # Upgrade pip and install deps
-pip install qrcode pillow
+pip install segno pillow numpy
 
 # Run the QR generator (expects main.py in same folder)
 if [[ ! -f "main.py" ]]; then